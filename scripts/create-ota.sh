@@ -115,6 +115,7 @@ cleanup() {
 trap cleanup EXIT
 
 echo "Version: $version"
+echo "OpenSSL: $(openssl version)"
 echo "> Prepare deploy directory"
 
 rm -f "$release_archive_path"
@@ -123,26 +124,37 @@ rm -rf "$release_path"
 echo "> Make directories"
 mkdir -p "$release_path"
 
+tmp_dir="$(mktemp -d)"
+digest_path="${tmp_dir}/kaonic-commd.sha256.bin"
+
 echo "> Copy files"
-cp "$binary_path" "$release_path/kaonic-commd"
+# Hash the binary while it is copied; the digest is reused for signing
+tee "$release_path/kaonic-commd" < "$binary_path" \
+    | openssl dgst -sha256 -binary -out "$digest_path"
+od -An -v -tx1 "$digest_path" | tr -d ' \n' > "$release_path/kaonic-commd.sha256"
+echo >> "$release_path/kaonic-commd.sha256"
+chmod 755 "$release_path/kaonic-commd"
 cp "$service_path" "$release_path/kaonic-commd.service"
 cp "$plugin_toml_path" "$release_path/kaonic-plugin.toml"
 printf '%s' "$version" > "$release_path/kaonic-commd.version"
-openssl dgst -sha256 "$release_path/kaonic-commd" | awk '{print $NF}' > "$release_path/kaonic-commd.sha256"
 
 if [[ -n "$sign_key" ]]; then
-    tmp_dir="$(mktemp -d)"
     pub_key_path="${tmp_dir}/ota_sign_key.pub.pem"
 
+    # Sign the precomputed digest; produces the same signature as
+    # `openssl dgst -sha256 -sign` without reading the binary again
     echo "> Sign $release_path/kaonic-commd"
-    openssl dgst -sha256 -sign "$sign_key" -out "$release_path/kaonic-commd.sig" "$release_path/kaonic-commd"
+    openssl pkeyutl -sign -inkey "$sign_key" -pkeyopt digest:sha256 \
+        -in "$digest_path" -out "$release_path/kaonic-commd.sig"
 
     echo "> Verify $release_path/kaonic-commd"
     openssl pkey -in "$sign_key" -pubout -out "$pub_key_path" >/dev/null 2>&1
-    openssl dgst -sha256 -verify "$pub_key_path" -signature "$release_path/kaonic-commd.sig" "$release_path/kaonic-commd" >/dev/null
+    openssl pkeyutl -verify -pubin -inkey "$pub_key_path" -pkeyopt digest:sha256 \
+        -in "$digest_path" -sigfile "$release_path/kaonic-commd.sig" >/dev/null
 fi
 
-(cd "$release_path" && zip -q -r "$release_archive_path" .)
+# Store without compression so the device only copies on extraction
+(cd "$release_path" && zip -q -0 -r "$release_archive_path" .)
 
 if [[ "$keep" -ne 1 ]]; then
     rm -rf "$release_path"
@@ -9,6 +9,7 @@ USER="root"                     # or another SSH user
 REMOTE_PATH="/usr/bin"          # where to upload the binary
 LOCAL_BIN="${PWD}/target/armv7-unknown-linux-gnueabihf/release/$1"           # binary name = first argument
 SERVICE_NAME="$1"               # service name = same as binary name
+REMOTE_BIN="$REMOTE_PATH/$(basename "$LOCAL_BIN")"
 
 # === Arguments check ===
 if [ "$#" -lt 2 ]; then
@@ -37,22 +38,20 @@ for IP in "${IPS[@]}"; do
         echo "Failed to stop $SERVICE_NAME on $IP, continuing..."
     }
 
-    # Copy file
-    echo "Uploading $LOCAL_BIN →  $USER@$IP:$REMOTE_PATH/"
-    scp "$LOCAL_BIN" "$USER@$IP:$REMOTE_PATH/" || {
+    # Copy file next to the target so the swap below is a same-filesystem rename
+    echo "Uploading $LOCAL_BIN →  $USER@$IP:$REMOTE_BIN.new"
+    scp "$LOCAL_BIN" "$USER@$IP:$REMOTE_BIN.new" || {
         echo "Failed to copy file to $IP"
         continue
     }
 
-    # Set permissions
-    ssh "$USER@$IP" "chmod +x $REMOTE_PATH/$(basename "$LOCAL_BIN")"
-
-    # Start service
+    # Set permissions, atomically replace the binary, start service and
+    # check status in a single SSH session
     echo "Starting $SERVICE_NAME on $IP..."
-    ssh "$USER@$IP" "systemctl start $SERVICE_NAME"
-
-    # Check status
-    ssh "$USER@$IP" "systemctl --no-pager --full status $SERVICE_NAME | head -n 10"
+    ssh "$USER@$IP" "chmod +x $REMOTE_BIN.new && sync \
+        && mv -f $REMOTE_BIN.new $REMOTE_BIN && sync \
+        && systemctl start $SERVICE_NAME \
+        && systemctl --no-pager --full status $SERVICE_NAME | head -n 10"
 
     echo "Done for $IP"
     echo